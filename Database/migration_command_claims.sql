@@ -0,0 +1,28 @@
+-- Migration: multi-instance safe command claiming
+-- Agents may long-poll any server instance behind a load balancer. Commands are claimed with
+-- SELECT ... FOR UPDATE SKIP LOCKED in a transaction and tagged with a claim token and a lease;
+-- a claim whose lease expires (instance or agent crashed mid-command) is re-queued, then failed
+-- after COMMAND_MAX_ATTEMPTS. Requires MySQL 8.0+ (SKIP LOCKED).
+-- Safe to re-run (uses IF NOT EXISTS / DROP IF EXISTS patterns)
+
+USE udm_multitenant;
+
+-- ============================================================
+-- 1. COMMAND_QUEUE — claim columns
+-- ============================================================
+ALTER TABLE `command_queue`
+  ADD COLUMN IF NOT EXISTS `claim_token`      char(32)     DEFAULT NULL AFTER `expires_at`,
+  ADD COLUMN IF NOT EXISTS `claimed_by`       varchar(100) DEFAULT NULL AFTER `claim_token`,
+  ADD COLUMN IF NOT EXISTS `lease_expires_at` datetime     DEFAULT NULL AFTER `claimed_by`,
+  ADD COLUMN IF NOT EXISTS `attempts`         int          NOT NULL DEFAULT 0 AFTER `lease_expires_at`;
+
+-- Lease sweep: WHERE status = 'processing' AND lease_expires_at < NOW()
+ALTER TABLE `command_queue`
+  ADD KEY IF NOT EXISTS `idx_cq_status_lease` (`status`, `lease_expires_at`);
+
+-- ============================================================
+-- 2. COMMAND_QUEUE_ARCHIVE — keep who claimed and how many times
+-- ============================================================
+ALTER TABLE `command_queue_archive`
+  ADD COLUMN IF NOT EXISTS `claimed_by` varchar(100) DEFAULT NULL AFTER `expires_at`,
+  ADD COLUMN IF NOT EXISTS `attempts`   int          NOT NULL DEFAULT 0 AFTER `claimed_by`;
@@ -0,0 +1,57 @@
+-- Migration: command queue lifecycle (expiry + archive)
+-- Pending commands carry an expires_at (per command type TTL): the service marks them 'expired'
+-- instead of delivering a stale door command when an agent reconnects. Finished commands are moved
+-- in batches to command_queue_archive, so command_queue only holds the in-flight set and the agent
+-- polling scan on idx_cq_agent_poll stays flat.
+-- Safe to re-run (uses IF NOT EXISTS / DROP IF EXISTS patterns)
+
+USE udm_multitenant;
+
+-- ============================================================
+-- 1. COMMAND_QUEUE — expiry
+-- ============================================================
+ALTER TABLE `command_queue`
+  ADD COLUMN IF NOT EXISTS `expires_at` datetime DEFAULT NULL AFTER `completed_at`;
+
+-- Expiry sweep: WHERE status = 'pending' AND expires_at <= NOW()
+-- Archive batch: WHERE status IN (finished) AND completed_at < @cutoff
+ALTER TABLE `command_queue`
+  ADD KEY IF NOT EXISTS `idx_cq_status_expires` (`status`, `expires_at`),
+  ADD KEY IF NOT EXISTS `idx_cq_status_completed` (`status`, `completed_at`);
+
+-- ============================================================
+-- 2. COMMAND_QUEUE_ARCHIVE — finished commands (same columns, no foreign keys)
+-- ============================================================
+-- Read by GET /{tenant}/commands/{id} when the id is no longer in command_queue.
+CREATE TABLE IF NOT EXISTS `command_queue_archive` (
+  `id`            int         NOT NULL,
+  `agent_id`      int         NOT NULL,
+  `door_id`       int         NOT NULL,
+  `user_id`       int         DEFAULT NULL,
+  `command_type`  varchar(50) NOT NULL,
+  `parameters`    text,
+  `status`        varchar(20) NOT NULL,
+  `result`        text,
+  `error_message` text,
+  `created_at`    datetime    NOT NULL,
+  `processed_at`  datetime    DEFAULT NULL,
+  `completed_at`  datetime    DEFAULT NULL,
+  `expires_at`    datetime    DEFAULT NULL,
+  PRIMARY KEY (`id`),
+  -- Archive purge: WHERE completed_at < NOW() - INTERVAL @days DAY
+  KEY `idx_cqa_completed` (`completed_at`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- ============================================================
+-- 3. DOOR_EVENTS — command_id may now point into the archive
+-- ============================================================
+-- ON DELETE SET NULL would clear door_events.command_id when a command is archived.
+ALTER TABLE `door_events`
+  DROP FOREIGN KEY IF EXISTS `fk_de_cmd`;
+
+-- ============================================================
+-- 4. Existing backlog: old pending commands must not fire on reconnect
+-- ============================================================
+UPDATE `command_queue`
+SET `status` = 'expired', `error_message` = 'Command expired before delivery to the agent', `completed_at` = NOW()
+WHERE `status` = 'pending' AND `expires_at` IS NULL AND `created_at` < NOW() - INTERVAL 5 MINUTE;
@@ -0,0 +1,23 @@
+-- Migration: millisecond command timestamps
+-- GET /metrics derives enqueue -> claim -> complete latency from command_queue.created_at,
+-- processed_at and completed_at; whole seconds are too coarse for door commands that take
+-- a few hundred milliseconds end to end. The service writes NOW(3) into these columns.
+-- Safe to re-run (MODIFY to the same definition is a no-op)
+
+USE udm_multitenant;
+
+-- ============================================================
+-- 1. COMMAND_QUEUE — datetime(3) stage timestamps
+-- ============================================================
+ALTER TABLE `command_queue`
+  MODIFY `created_at`   datetime(3) NOT NULL DEFAULT CURRENT_TIMESTAMP(3),
+  MODIFY `processed_at` datetime(3) DEFAULT NULL,
+  MODIFY `completed_at` datetime(3) DEFAULT NULL;
+
+-- ============================================================
+-- 2. COMMAND_QUEUE_ARCHIVE — same precision (INSERT ... SELECT from command_queue)
+-- ============================================================
+ALTER TABLE `command_queue_archive`
+  MODIFY `created_at`   datetime(3) NOT NULL,
+  MODIFY `processed_at` datetime(3) DEFAULT NULL,
+  MODIFY `completed_at` datetime(3) DEFAULT NULL;
@@ -0,0 +1,29 @@
+-- Migration: per-command stage trace
+-- The agent reports when it received a command, when the terminal connection was ready, when
+-- UnlockDoor returned and when it sent the result. The service stores these stages on the
+-- command_queue row next to created_at (enqueue), processed_at (claim) and completed_at
+-- (result received), and serves them through GET /{tenant}/commands/{id}/trace and
+-- GET /{tenant}/commands/latency. Requires migration_command_timing.sql (datetime(3)).
+-- Safe to re-run (uses IF NOT EXISTS patterns)
+
+USE udm_multitenant;
+
+-- ============================================================
+-- 1. COMMAND_QUEUE — agent stage timestamps (server clock, milliseconds)
+-- ============================================================
+ALTER TABLE `command_queue`
+  ADD COLUMN IF NOT EXISTS `agent_received_at`     datetime(3) DEFAULT NULL AFTER `completed_at`,
+  ADD COLUMN IF NOT EXISTS `terminal_connected_at` datetime(3) DEFAULT NULL AFTER `agent_received_at`,
+  ADD COLUMN IF NOT EXISTS `unlock_returned_at`    datetime(3) DEFAULT NULL AFTER `terminal_connected_at`,
+  ADD COLUMN IF NOT EXISTS `result_sent_at`        datetime(3) DEFAULT NULL AFTER `unlock_returned_at`;
+
+-- ============================================================
+-- 2. COMMAND_QUEUE_ARCHIVE — same columns, and the latency summary lookup
+-- ============================================================
+-- GET /{tenant}/commands/latency: WHERE agent_id IN (agents of the tenant) AND completed_at >= @since
+ALTER TABLE `command_queue_archive`
+  ADD COLUMN IF NOT EXISTS `agent_received_at`     datetime(3) DEFAULT NULL AFTER `completed_at`,
+  ADD COLUMN IF NOT EXISTS `terminal_connected_at` datetime(3) DEFAULT NULL AFTER `agent_received_at`,
+  ADD COLUMN IF NOT EXISTS `unlock_returned_at`    datetime(3) DEFAULT NULL AFTER `terminal_connected_at`,
+  ADD COLUMN IF NOT EXISTS `result_sent_at`        datetime(3) DEFAULT NULL AFTER `unlock_returned_at`,
+  ADD KEY IF NOT EXISTS `idx_cqa_agent_completed` (`agent_id`, `completed_at`);
@@ -0,0 +1,52 @@
+-- Migration: door_events retention (per-enterprise) and daily partitions
+-- The service (DoorEventsRetention) runs hourly: it pre-creates the next daily partitions, drops the days
+-- older than the longest enterprise retention, then deletes the remainder per enterprise in small chunks.
+-- Sections 1-2 are required. Section 3 (partitioning) is optional: without it, retention runs in
+-- chunked-delete mode only. Safe to re-run (uses IF NOT EXISTS / DROP IF EXISTS patterns)
+
+USE udm_multitenant;
+
+-- ============================================================
+-- 1. ENTERPRISES — retention in hours (NULL = DOOR_EVENTS_RETENTION_HOURS, default 72)
+-- ============================================================
+ALTER TABLE `enterprises`
+  ADD COLUMN IF NOT EXISTS `event_retention_hours` int DEFAULT NULL AFTER `license_end_date`;
+
+-- ============================================================
+-- 2. DOOR_EVENTS — chunked retention delete
+-- ============================================================
+-- DELETE ... WHERE door_id IN (doors of @ent) AND created_at < @cutoff LIMIT @chunk
+-- created_at is COALESCE(event_time, NOW()) at insert, so it is the only retention criterion.
+ALTER TABLE `door_events`
+  ADD KEY IF NOT EXISTS `idx_de_door_retention` (`door_id`, `created_at`);
+
+-- ============================================================
+-- 3. DOOR_EVENTS — daily partitions on created_at (optional)
+-- ============================================================
+-- Partitioned InnoDB tables cannot have foreign keys, and every unique key must contain
+-- the partition column. door_id rows are no longer cascaded: doors are soft-deleted
+-- (is_active = 0), and retention removes their events like any other.
+ALTER TABLE `door_events`
+  DROP FOREIGN KEY IF EXISTS `fk_de_door`,
+  DROP FOREIGN KEY IF EXISTS `fk_de_user`,
+  DROP FOREIGN KEY IF EXISTS `fk_de_agent`,
+  DROP FOREIGN KEY IF EXISTS `fk_de_cmd`;
+
+-- This key no longer dedups an ingress event re-sent without event_time (created_at = NOW() differs):
+-- run migration_ingress_event_keys.sql, which moves ingress dedup to a non-partitioned key table.
+ALTER TABLE `door_events`
+  DROP PRIMARY KEY,
+  ADD PRIMARY KEY (`id`, `created_at`),
+  DROP INDEX IF EXISTS `uq_de_agent_ingress`,
+  ADD UNIQUE KEY `uq_de_agent_ingress` (`agent_id`, `ingress_event_id`, `created_at`);
+
+-- History up to yesterday in one partition (pYYYYMMDD holds day YYYY-MM-DD and everything before it),
+-- then pmax. The service splits pmax into daily partitions on its next run.
+SET @today = CURDATE();
+SET @sql = CONCAT(
+  'ALTER TABLE `door_events` PARTITION BY RANGE (TO_DAYS(`created_at`)) (',
+  'PARTITION p', DATE_FORMAT(@today - INTERVAL 1 DAY, '%Y%m%d'), ' VALUES LESS THAN (', TO_DAYS(@today), '), ',
+  'PARTITION pmax VALUES LESS THAN MAXVALUE)');
+PREPARE stmt FROM @sql;
+EXECUTE stmt;
+DEALLOCATE PREPARE stmt;
@@ -0,0 +1,18 @@
+-- Migration: keyset pagination on door_events
+-- /{tenant}/events now pages by id (before_id / after_id) instead of ORDER BY created_at,
+-- and its ETag probe reads the newest id per door. (door_id, id) serves both.
+-- Safe to re-run (uses IF NOT EXISTS / DROP IF EXISTS patterns)
+
+USE udm_multitenant;
+
+-- ============================================================
+-- 1. DOOR_EVENTS — (door_id, id) replaces (door_id, created_at DESC)
+-- ============================================================
+-- WHERE door_id = @did AND id < @before ORDER BY id DESC LIMIT N
+-- WHERE door_id = @did AND id > @after  ORDER BY id DESC LIMIT N
+-- Also backs the fk_de_door foreign key.
+ALTER TABLE `door_events`
+  ADD KEY IF NOT EXISTS `idx_de_door_id` (`door_id`, `id`);
+
+ALTER TABLE `door_events`
+  DROP INDEX IF EXISTS `idx_de_door_created`;
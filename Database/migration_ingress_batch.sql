@@ -0,0 +1,24 @@
+-- Migration: batched ingress ingestion
+-- Replaces the per-event IngressEventExists lookup with a unique (agent_id, ingress_event_id) key;
+-- the server inserts whole batches with INSERT IGNORE in a single transaction.
+-- Safe to re-run (uses IF NOT EXISTS / DROP IF EXISTS patterns)
+
+USE udm_multitenant;
+
+-- ============================================================
+-- 1. DOOR_EVENTS — remove duplicates left by the old check-then-insert path
+-- ============================================================
+DELETE de
+FROM `door_events` de
+INNER JOIN `door_events` keep_row
+        ON keep_row.agent_id = de.agent_id
+       AND keep_row.ingress_event_id = de.ingress_event_id
+       AND keep_row.id < de.id
+WHERE de.ingress_event_id IS NOT NULL;
+
+-- ============================================================
+-- 2. DOOR_EVENTS — unique ingress key (NULL ingress_event_id = command events, not constrained)
+-- ============================================================
+ALTER TABLE `door_events`
+  DROP INDEX IF EXISTS `idx_de_ingress`,
+  ADD UNIQUE KEY IF NOT EXISTS `uq_de_agent_ingress` (`agent_id`, `ingress_event_id`);
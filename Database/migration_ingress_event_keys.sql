@@ -0,0 +1,28 @@
+-- Migration: ingress dedup table
+-- The partitioned door_events needs created_at in its unique ingress key. An event re-sent without a
+-- usable event_time gets a new created_at (NOW()) and slipped past that key. ingress_event_keys holds
+-- (agent_id, ingress_event_id) alone; the server inserts into door_events only the events whose key it created.
+-- Run after migration_door_events_partitions.sql. Safe to re-run (uses IF NOT EXISTS / INSERT IGNORE)
+
+USE udm_multitenant;
+
+-- ============================================================
+-- 1. INGRESS_EVENT_KEYS
+-- ============================================================
+CREATE TABLE IF NOT EXISTS `ingress_event_keys` (
+  `agent_id`         int        NOT NULL,
+  `ingress_event_id` int        NOT NULL,
+  `batch_id`         binary(16) NOT NULL,
+  `created_at`       datetime   NOT NULL DEFAULT CURRENT_TIMESTAMP,
+  PRIMARY KEY (`agent_id`, `ingress_event_id`),
+  KEY `idx_iek_created` (`created_at`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- ============================================================
+-- 2. Backfill from the events already stored, so their re-sends are skipped too
+-- ============================================================
+INSERT IGNORE INTO `ingress_event_keys` (`agent_id`, `ingress_event_id`, `batch_id`, `created_at`)
+SELECT `agent_id`, `ingress_event_id`, UNHEX(REPEAT('0', 32)), MIN(`created_at`)
+FROM `door_events`
+WHERE `agent_id` IS NOT NULL AND `ingress_event_id` IS NOT NULL
+GROUP BY `agent_id`, `ingress_event_id`;
@@ -32,6 +32,8 @@ CREATE TABLE `enterprises` (
   `user_quota`         int          NOT NULL DEFAULT 2,
   `license_start_date` date         DEFAULT NULL,
   `license_end_date`   date         DEFAULT NULL,
+  -- door_events retention in hours; NULL = DOOR_EVENTS_RETENTION_HOURS (service config)
+  `event_retention_hours` int       DEFAULT NULL,
   `created_at`         datetime     NOT NULL DEFAULT CURRENT_TIMESTAMP,
   `is_active`          tinyint(1)   NOT NULL DEFAULT 1,
   PRIMARY KEY (`id`),
@@ -142,7 +144,9 @@ CREATE TABLE `user_door_permissions` (
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
 /* ============================================================
-   command_queue — agent command pipeline
+   command_queue — agent command pipeline (in-flight set only)
+   Finished commands are moved to command_queue_archive in batches;
+   pending commands past expires_at are marked 'expired', never delivered.
    ============================================================ */
 DROP TABLE IF EXISTS `command_queue`;
 
@@ -156,12 +160,30 @@ CREATE TABLE `command_queue` (
   `status`        varchar(20) NOT NULL DEFAULT 'pending',
   `result`        text,
   `error_message` text,
-  `created_at`    datetime    NOT NULL DEFAULT CURRENT_TIMESTAMP,
-  `processed_at`  datetime    DEFAULT NULL,
-  `completed_at`  datetime    DEFAULT NULL,
+  -- Stage timestamps in milliseconds: /metrics enqueue -> claim -> complete latency
+  `created_at`    datetime(3) NOT NULL DEFAULT CURRENT_TIMESTAMP(3),
+  `processed_at`  datetime(3) DEFAULT NULL,
+  `completed_at`  datetime(3) DEFAULT NULL,
+  -- Agent-reported stages (server clock): received, terminal connected, UnlockDoor returned, result sent
+  `agent_received_at`     datetime(3) DEFAULT NULL,
+  `terminal_connected_at` datetime(3) DEFAULT NULL,
+  `unlock_returned_at`    datetime(3) DEFAULT NULL,
+  `result_sent_at`        datetime(3) DEFAULT NULL,
+  `expires_at`    datetime    DEFAULT NULL,
+  -- Claim (SELECT ... FOR UPDATE SKIP LOCKED): token echoed by the agent with its result
+  `claim_token`   char(32)    DEFAULT NULL,
+  `claimed_by`    varchar(100) DEFAULT NULL,
+  `lease_expires_at` datetime DEFAULT NULL,
+  `attempts`      int         NOT NULL DEFAULT 0,
   PRIMARY KEY (`id`),
   -- HOT PATH — agent polling: WHERE agent_id = @aid AND status = 'pending' ORDER BY created_at ASC
   KEY `idx_cq_agent_poll` (`agent_id`, `status`, `created_at`),
+  -- Expiry sweep: WHERE status = 'pending' AND expires_at <= NOW()
+  KEY `idx_cq_status_expires` (`status`, `expires_at`),
+  -- Archive batch: WHERE status IN (finished) AND completed_at < @cutoff
+  KEY `idx_cq_status_completed` (`status`, `completed_at`),
+  -- Lease sweep: WHERE status = 'processing' AND lease_expires_at < NOW()
+  KEY `idx_cq_status_lease` (`status`, `lease_expires_at`),
   KEY `fk_cq_door` (`door_id`),
   KEY `fk_cq_user` (`user_id`),
   CONSTRAINT `fk_cq_agent` FOREIGN KEY (`agent_id`) REFERENCES `agents` (`id`) ON DELETE CASCADE,
@@ -169,8 +191,44 @@ CREATE TABLE `command_queue` (
   CONSTRAINT `fk_cq_user`  FOREIGN KEY (`user_id`)  REFERENCES `users`  (`id`) ON DELETE SET NULL
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
+/* ============================================================
+   command_queue_archive — finished commands (same columns, no foreign keys)
+   ============================================================ */
+DROP TABLE IF EXISTS `command_queue_archive`;
+
+CREATE TABLE `command_queue_archive` (
+  `id`            int         NOT NULL,
+  `agent_id`      int         NOT NULL,
+  `door_id`       int         NOT NULL,
+  `user_id`       int         DEFAULT NULL,
+  `command_type`  varchar(50) NOT NULL,
+  `parameters`    text,
+  `status`        varchar(20) NOT NULL,
+  `result`        text,
+  `error_message` text,
+  `created_at`    datetime(3) NOT NULL,
+  `processed_at`  datetime(3) DEFAULT NULL,
+  `completed_at`  datetime(3) DEFAULT NULL,
+  `agent_received_at`     datetime(3) DEFAULT NULL,
+  `terminal_connected_at` datetime(3) DEFAULT NULL,
+  `unlock_returned_at`    datetime(3) DEFAULT NULL,
+  `result_sent_at`        datetime(3) DEFAULT NULL,
+  `expires_at`    datetime    DEFAULT NULL,
+  `claimed_by`    varchar(100) DEFAULT NULL,
+  `attempts`      int         NOT NULL DEFAULT 0,
+  PRIMARY KEY (`id`),
+  -- GET /commands/{id} fallback is a primary key read
+  -- Archive purge: WHERE completed_at < NOW() - INTERVAL @days DAY
+  KEY `idx_cqa_completed` (`completed_at`),
+  -- Latency summary: WHERE agent_id IN (agents of the tenant) AND completed_at >= @since
+  KEY `idx_cqa_agent_completed` (`agent_id`, `completed_at`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
 /* ============================================================
    door_events — audit log of all door activity
+   Daily RANGE partitions on created_at: the service pre-creates the next days by splitting
+   pmax and drops expired days (DoorEventsRetention). No foreign keys: partitioned InnoDB
+   tables do not support them (doors are soft-deleted, so no cascade is needed).
    ============================================================ */
 DROP TABLE IF EXISTS `door_events`;
 
@@ -187,19 +245,40 @@ CREATE TABLE `door_events` (
   `ingress_user_id`  varchar(50) DEFAULT NULL,
   `ingress_event_id` int         DEFAULT NULL,
   `source`           varchar(20) NOT NULL DEFAULT 'command',
-  PRIMARY KEY (`id`),
-  -- HOT PATH — event listing: WHERE door_id = @did ORDER BY created_at DESC LIMIT N
-  -- DESC index for optimal reverse-chronological scans (MySQL 8.0+)
-  KEY `idx_de_door_created` (`door_id`, `created_at` DESC),
-  -- Ingress dedup: prevent re-inserting same ingress event
-  KEY `idx_de_ingress` (`ingress_event_id`),
+  -- created_at is part of every unique key (partitioning requirement)
+  PRIMARY KEY (`id`, `created_at`),
+  -- HOT PATH — event listing (keyset): WHERE door_id = @did AND id < @before ORDER BY id DESC LIMIT N
+  -- also after_id refresh (id > @after) and the ETag probe (newest id)
+  KEY `idx_de_door_id` (`door_id`, `id`),
+  -- Retention: WHERE door_id IN (doors of @ent) AND created_at < @cutoff LIMIT @chunk
+  KEY `idx_de_door_retention` (`door_id`, `created_at`),
+  -- Second line of ingress dedup only: created_at differs on a re-send when event_time is NULL,
+  -- duplicates are filtered by ingress_event_keys before the insert
+  UNIQUE KEY `uq_de_agent_ingress` (`agent_id`, `ingress_event_id`, `created_at`),
   KEY `fk_de_user`  (`user_id`),
   KEY `fk_de_agent` (`agent_id`),
-  KEY `fk_de_cmd`   (`command_id`),
-  CONSTRAINT `fk_de_door`  FOREIGN KEY (`door_id`)    REFERENCES `doors`         (`id`) ON DELETE CASCADE,
-  CONSTRAINT `fk_de_user`  FOREIGN KEY (`user_id`)    REFERENCES `users`         (`id`) ON DELETE SET NULL,
-  CONSTRAINT `fk_de_agent` FOREIGN KEY (`agent_id`)   REFERENCES `agents`        (`id`) ON DELETE SET NULL,
-  CONSTRAINT `fk_de_cmd`   FOREIGN KEY (`command_id`) REFERENCES `command_queue` (`id`) ON DELETE SET NULL
+  KEY `fk_de_cmd`   (`command_id`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+PARTITION BY RANGE (TO_DAYS(`created_at`)) (
+  PARTITION pmax VALUES LESS THAN MAXVALUE
+);
+
+/* ============================================================
+   ingress_event_keys — ingress dedup, one row per event received
+   Not partitioned, so the key is (agent_id, ingress_event_id) alone. A batch
+   claims its keys with INSERT IGNORE, reads back those carrying its batch_id,
+   and writes only those events to door_events. Pruned by DoorEventsRetention.
+   ============================================================ */
+DROP TABLE IF EXISTS `ingress_event_keys`;
+
+CREATE TABLE `ingress_event_keys` (
+  `agent_id`         int        NOT NULL,
+  `ingress_event_id` int        NOT NULL,
+  `batch_id`         binary(16) NOT NULL,
+  `created_at`       datetime   NOT NULL DEFAULT CURRENT_TIMESTAMP,
+  PRIMARY KEY (`agent_id`, `ingress_event_id`),
+  -- Retention: WHERE created_at < @cutoff LIMIT @chunk
+  KEY `idx_iek_created` (`created_at`)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
 /* ============================================================
@@ -10,6 +10,7 @@ import {
   RefreshControl,
   Dimensions,
   Platform,
+  ActivityIndicator,
 } from 'react-native';
 import { SafeAreaView } from 'react-native-safe-area-context';
 import {
@@ -51,6 +52,8 @@ function getEventIcon(eventType, colors) {
   return { icon: Shield, color: colors.textSecondary, bg: colors.fillTertiary };
 }
 
+const EVENTS_PAGE_SIZE = 100;
+
 export default function ActivityLogScreen({ route, navigation }) {
   const { colors } = useTheme();
   const doorId = route.params?.doorId || null;
@@ -58,6 +61,9 @@ export default function ActivityLogScreen({ route, navigation }) {
   const [events, setEvents] = useState([]);
   const [loading, setLoading] = useState(true);
   const [refreshing, setRefreshing] = useState(false);
+  const [hasMore, setHasMore] = useState(false);
+  const [loadingMore, setLoadingMore] = useState(false);
+  const eventsRef = useRef([]);
   const fadeAnim = useRef(new Animated.Value(0)).current;
 
   useEffect(() => {
@@ -65,11 +71,27 @@ export default function ActivityLogScreen({ route, navigation }) {
     Animated.timing(fadeAnim, { toValue: 1, duration: 350, useNativeDriver: true }).start();
   }, []);
 
+  const showEvents = (list) => {
+    eventsRef.current = list;
+    setEvents(list);
+  };
+
+  // Refresh fetches only events newer than the newest one shown (after_id);
+  // first load or a gap larger than a page reloads the first page (304 when unchanged).
   const loadEvents = async () => {
     try {
       setLoading(true);
-      const data = await api.getEvents(doorId, 100);
-      setEvents(data);
+      const current = eventsRef.current;
+      if (current.length > 0) {
+        const delta = await api.getEvents(doorId, EVENTS_PAGE_SIZE, { afterId: current[0].id });
+        if (!delta.hasMore) {
+          if (delta.events.length > 0) showEvents([...delta.events, ...current]);
+          return;
+        }
+      }
+      const page = await api.getEvents(doorId, EVENTS_PAGE_SIZE);
+      showEvents(page.events);
+      setHasMore(page.hasMore);
     } catch (error) {
       Alert.alert('Error', error.message);
     } finally {
@@ -78,6 +100,21 @@ export default function ActivityLogScreen({ route, navigation }) {
     }
   };
 
+  const loadOlder = async () => {
+    const current = eventsRef.current;
+    if (!hasMore || loadingMore || current.length === 0) return;
+    setLoadingMore(true);
+    try {
+      const page = await api.getEvents(doorId, EVENTS_PAGE_SIZE, { beforeId: current[current.length - 1].id });
+      showEvents([...current, ...page.events]);
+      setHasMore(page.hasMore);
+    } catch (error) {
+      Alert.alert('Error', error.message);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const renderEvent = ({ item }) => {
     const { icon: Icon, color, bg } = getEventIcon(item.event_type, colors);
     return (
@@ -138,6 +175,11 @@ export default function ActivityLogScreen({ route, navigation }) {
           renderItem={renderEvent}
           contentContainerStyle={styles.listContent}
           showsVerticalScrollIndicator={false}
+          onEndReached={loadOlder}
+          onEndReachedThreshold={0.5}
+          ListFooterComponent={loadingMore ? (
+            <ActivityIndicator style={{ marginVertical: 16 }} color={colors.primary} />
+          ) : null}
           refreshControl={
             <RefreshControl
               refreshing={refreshing}
@@ -23,6 +23,8 @@ import Logo from '../components/Logo';
 const { width, height: SCREEN_HEIGHT } = Dimensions.get('window');
 const BUTTON_SIZE = Math.min(width * 0.45, 180);
 const DISMISS_THRESHOLD = 120;
+// Seconds the server may hold open/close until the agent reports the real outcome
+const DOOR_COMMAND_WAIT_SECONDS = 10;
 
 const LICENSE_ALERT_TITLE = 'License Expired';
 
@@ -255,9 +257,9 @@ export default function DoorControlScreen({ route, navigation }) {
     setIsUnlocking(true);
 
     try {
-      await api.openDoor(door.id, door.default_delay || 3000);
+      const result = await api.openDoor(door.id, door.default_delay || 3000, DOOR_COMMAND_WAIT_SECONDS);
       await Haptics.notificationAsync(Haptics.NotificationFeedbackType.Success);
-      setStatus('Unlocked');
+      setStatus(result.status === 'completed' ? 'Unlocked' : 'Pending');
       triggerSuccessAnimation();
 
       setTimeout(() => {
@@ -280,10 +282,14 @@ export default function DoorControlScreen({ route, navigation }) {
   const closeDoor = async () => {
     setLoading(true);
     try {
-      await api.closeDoor(door.id);
+      const result = await api.closeDoor(door.id, DOOR_COMMAND_WAIT_SECONDS);
       await Haptics.notificationAsync(Haptics.NotificationFeedbackType.Success);
-      setStatus('Secured');
-      Alert.alert('Locked', 'Door has been locked successfully.');
+      if (result.status === 'completed') {
+        setStatus('Secured');
+        Alert.alert('Locked', 'Door has been locked successfully.');
+      } else {
+        Alert.alert('Queued', 'The lock command was sent but not yet confirmed by the door agent.');
+      }
     } catch (error) {
       await Haptics.notificationAsync(Haptics.NotificationFeedbackType.Error);
       if (error.isLicenseExpired) {
@@ -307,41 +313,27 @@ export default function DoorControlScreen({ route, navigation }) {
         return;
       }
 
-      // Poll for result every 500ms, max 10s
-      const maxWait = 10000;
-      const interval = 500;
-      let elapsed = 0;
-
-      while (elapsed < maxWait) {
-        await new Promise(resolve => setTimeout(resolve, interval));
-        elapsed += interval;
-
-        try {
-          const cmdResult = await api.getCommandResult(commandId);
-          if (cmdResult.status === 'completed') {
-            // Parse the result string to extract status
-            let doorStatus = 'Unknown';
-            if (cmdResult.result) {
-              try {
-                const parsed = JSON.parse(cmdResult.result);
-                doorStatus = parsed.status || 'Unknown';
-              } catch {
-                doorStatus = cmdResult.result;
-              }
-            }
-            const displayStatus = doorStatus === 'connected' ? 'Secured' : doorStatus.charAt(0).toUpperCase() + doorStatus.slice(1);
-            setStatus(displayStatus);
-            await Haptics.notificationAsync(Haptics.NotificationFeedbackType.Success);
-            Alert.alert('Door Status', `Current status: ${displayStatus}`);
-            return;
-          } else if (cmdResult.status === 'failed') {
-            Alert.alert('Error', cmdResult.error_message || 'Status check failed');
-            return;
+      // Server holds the request until the agent reports (max 10s)
+      const cmdResult = await api.waitForCommandResult(commandId, 10);
+      if (cmdResult.status === 'completed') {
+        // Parse the result string to extract status
+        let doorStatus = 'Unknown';
+        if (cmdResult.result) {
+          try {
+            const parsed = JSON.parse(cmdResult.result);
+            doorStatus = parsed.status || 'Unknown';
+          } catch {
+            doorStatus = cmdResult.result;
           }
-          // Still pending/processing, keep polling
-        } catch {
-          // Polling error, continue
         }
+        const displayStatus = doorStatus === 'connected' ? 'Secured' : doorStatus.charAt(0).toUpperCase() + doorStatus.slice(1);
+        setStatus(displayStatus);
+        await Haptics.notificationAsync(Haptics.NotificationFeedbackType.Success);
+        Alert.alert('Door Status', `Current status: ${displayStatus}`);
+        return;
+      } else if (cmdResult.status === 'failed') {
+        Alert.alert('Error', cmdResult.error_message || 'Status check failed');
+        return;
       }
 
       // Timeout
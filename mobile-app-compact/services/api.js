@@ -1,11 +1,14 @@
 import AsyncStorage from '@react-native-async-storage/async-storage';
 import { SERVER_URL } from '../config';
 
+const EVENTS_CACHE_SIZE = 20;
+
 class ApiService {
   constructor() {
     this.baseUrl = null;
     this.token = null;
     this.tenant = null;
+    this.eventsCache = new Map();
   }
 
   async initialize() {
@@ -36,6 +39,7 @@ class ApiService {
   async setToken(token, tenant) {
     this.token = token;
     this.tenant = tenant;
+    this.eventsCache.clear();
     
     // AsyncStorage ne peut pas stocker null/undefined
     if (token) {
@@ -54,6 +58,7 @@ class ApiService {
   async clearAuth() {
     this.token = null;
     this.tenant = null;
+    this.eventsCache.clear();
     await AsyncStorage.removeItem('token');
     await AsyncStorage.removeItem('tenant');
   }
@@ -173,13 +178,16 @@ class ApiService {
     return data.doors || [];
   }
 
-  async openDoor(doorId, delay = 3000) {
+  // wait > 0: the server holds the request until the agent reports (max `wait` seconds)
+  // and returns the real status plus latency_ms instead of "Command queued".
+  async openDoor(doorId, delay = 3000, wait = 0) {
     await this.initialize();
     if (!this.baseUrl || !this.token || !this.tenant) {
       throw new Error('Not authenticated');
     }
 
-    const url = `${this.baseUrl}/${this.tenant}/doors/${doorId}/open`;
+    const query = wait > 0 ? `?wait=${wait}` : '';
+    const url = `${this.baseUrl}/${this.tenant}/doors/${doorId}/open${query}`;
     const response = await fetch(url, {
       method: 'POST',
       headers: {
@@ -194,16 +202,23 @@ class ApiService {
     }
 
     const data = await response.json();
+    if (data.status === 'failed') {
+      throw new Error(data.error_message || 'Failed to open door');
+    }
+    if (data.status === 'expired') {
+      throw new Error('The door controller did not respond in time. Please try again.');
+    }
     return data;
   }
 
-  async closeDoor(doorId) {
+  async closeDoor(doorId, wait = 0) {
     await this.initialize();
     if (!this.baseUrl || !this.token || !this.tenant) {
       throw new Error('Not authenticated');
     }
 
-    const url = `${this.baseUrl}/${this.tenant}/doors/${doorId}/close`;
+    const query = wait > 0 ? `?wait=${wait}` : '';
+    const url = `${this.baseUrl}/${this.tenant}/doors/${doorId}/close${query}`;
     const response = await fetch(url, {
       method: 'POST',
       headers: {
@@ -217,6 +232,12 @@ class ApiService {
     }
 
     const data = await response.json();
+    if (data.status === 'failed') {
+      throw new Error(data.error_message || 'Failed to close door');
+    }
+    if (data.status === 'expired') {
+      throw new Error('The door controller did not respond in time. Please try again.');
+    }
     return data;
   }
 
@@ -399,6 +420,29 @@ class ApiService {
     return await response.json();
   }
 
+  // Long-poll until the agent reports the final status (server holds the request up to `timeout` seconds)
+  async waitForCommandResult(commandId, timeout = 10) {
+    await this.initialize();
+    if (!this.baseUrl || !this.token || !this.tenant) {
+      throw new Error('Not authenticated');
+    }
+
+    const url = `${this.baseUrl}/${this.tenant}/commands/${commandId}/wait?timeout=${timeout}`;
+    const response = await fetch(url, {
+      method: 'GET',
+      headers: {
+        'Authorization': `Bearer ${this.token}`,
+        'Content-Type': 'application/json',
+      },
+    });
+
+    if (!response.ok) {
+      await this._throwIfNotOk(response, 'Failed to get command result');
+    }
+
+    return await response.json();
+  }
+
   // ===== User Profile =====
   async getProfile() {
     await this.initialize();
@@ -535,20 +579,38 @@ class ApiService {
   }
 
   // ===== Events =====
-  async getEvents(doorId = null, limit = 50) {
+  // Newest first. Cursors: beforeId = older page, afterId = only events newer than the client's newest.
+  // Returns { events, hasMore, latestId }. The last response per URL is kept with its ETag, so an
+  // unchanged log comes back as 304 and is served from memory.
+  async getEvents(doorId = null, limit = 50, { beforeId = null, afterId = null } = {}) {
     await this.initialize();
     if (!this.baseUrl || !this.token || !this.tenant) throw new Error('Not authenticated');
     let url = `${this.baseUrl}/${this.tenant}/events?limit=${limit}`;
     if (doorId) url += `&door_id=${doorId}`;
-    const response = await fetch(url, {
-      method: 'GET',
-      headers: { 'Authorization': `Bearer ${this.token}`, 'Content-Type': 'application/json' },
-    });
+    if (beforeId) url += `&before_id=${beforeId}`;
+    if (afterId) url += `&after_id=${afterId}`;
+    const headers = { 'Authorization': `Bearer ${this.token}`, 'Content-Type': 'application/json' };
+    const cached = this.eventsCache.get(url);
+    if (cached) headers['If-None-Match'] = cached.etag;
+    const response = await fetch(url, { method: 'GET', headers });
+    if (response.status === 304 && cached) {
+      return cached.data;
+    }
     if (!response.ok) {
       await this._throwIfNotOk(response, 'Failed to get events');
     }
-    const data = await response.json();
-    return data.events || [];
+    const body = await response.json();
+    const data = { events: body.events || [], hasMore: !!body.has_more, latestId: body.latest_id || 0 };
+    const etag = response.headers.get('ETag');
+    // Older pages (beforeId) are fetched once while scrolling; only cache the views that get refreshed
+    if (etag && !beforeId) {
+      this.eventsCache.delete(url);
+      this.eventsCache.set(url, { etag, data });
+      if (this.eventsCache.size > EVENTS_CACHE_SIZE) {
+        this.eventsCache.delete(this.eventsCache.keys().next().value);
+      }
+    }
+    return data;
   }
 
   // ===== Notifications =====
@@ -1,7 +1,7 @@
-import React, { useState, useEffect, useCallback } from 'react';
+import React, { useState, useEffect, useCallback, useRef } from 'react';
 import {
   View, Text, SectionList, StyleSheet, Alert, Modal,
-  TouchableOpacity, RefreshControl,
+  TouchableOpacity, RefreshControl, ActivityIndicator,
 } from 'react-native';
 import { SafeAreaView, useSafeAreaInsets } from 'react-native-safe-area-context';
 import {
@@ -265,6 +265,8 @@ function EventDetailModal({ event, colors, onClose }) {
 
 // ─── Main screen ──────────────────────────────────────────────────────────────
 
+const EVENTS_PAGE_SIZE = 100;
+
 export default function ActivityLogScreen({ route, navigation }) {
   const { colors } = useTheme();
   const { scaleFont, spacing } = useResponsive();
@@ -273,11 +275,30 @@ export default function ActivityLogScreen({ route, navigation }) {
   const [loading, setLoading] = useState(true);
   const [refreshing, setRefreshing] = useState(false);
   const [selectedEvent, setSelectedEvent] = useState(null);
+  const [hasMore, setHasMore] = useState(false);
+  const [loadingMore, setLoadingMore] = useState(false);
+  const eventsRef = useRef([]);
+
+  const showEvents = (events) => {
+    eventsRef.current = events;
+    setSections(groupByDate(enrichEvents(events)));
+  };
 
+  // Pull-to-refresh only asks for events newer than the newest one shown (after_id).
+  // First load, or a gap larger than a page, fetches the first page (304 when unchanged).
   const loadEvents = useCallback(async () => {
     try {
-      const events = await api.getEvents(door?.id, 200);
-      setSections(groupByDate(enrichEvents(events)));
+      const current = eventsRef.current;
+      if (current.length > 0) {
+        const delta = await api.getEvents(door?.id, EVENTS_PAGE_SIZE, { afterId: current[0].id });
+        if (!delta.hasMore) {
+          if (delta.events.length > 0) showEvents([...delta.events, ...current]);
+          return;
+        }
+      }
+      const page = await api.getEvents(door?.id, EVENTS_PAGE_SIZE);
+      showEvents(page.events);
+      setHasMore(page.hasMore);
     } catch (error) {
       Alert.alert('Error', error.message);
     } finally {
@@ -286,6 +307,21 @@ export default function ActivityLogScreen({ route, navigation }) {
     }
   }, [door?.id]);
 
+  const loadOlder = useCallback(async () => {
+    const current = eventsRef.current;
+    if (!hasMore || loadingMore || current.length === 0) return;
+    setLoadingMore(true);
+    try {
+      const page = await api.getEvents(door?.id, EVENTS_PAGE_SIZE, { beforeId: current[current.length - 1].id });
+      showEvents([...current, ...page.events]);
+      setHasMore(page.hasMore);
+    } catch (error) {
+      Alert.alert('Error', error.message);
+    } finally {
+      setLoadingMore(false);
+    }
+  }, [door?.id, hasMore, loadingMore]);
+
   useEffect(() => { loadEvents(); }, [loadEvents]);
 
   return (
@@ -317,6 +353,11 @@ export default function ActivityLogScreen({ route, navigation }) {
           keyExtractor={(item, i) => String(item.id || i)}
           contentContainerStyle={[styles.content, sections.length === 0 && styles.emptyContent]}
           stickySectionHeadersEnabled
+          onEndReached={loadOlder}
+          onEndReachedThreshold={0.5}
+          ListFooterComponent={loadingMore ? (
+            <ActivityIndicator style={{ marginVertical: 16 }} color={colors.primary} />
+          ) : null}
           refreshControl={
             <RefreshControl
               refreshing={refreshing}
@@ -14,6 +14,8 @@ import { useRootNavigation } from '../contexts/RootNavigationContext';
 import useResponsive from '../hooks/useResponsive';
 
 const { height: SCREEN_HEIGHT } = Dimensions.get('window');
+// Seconds the server may hold open/close until the agent reports the real outcome
+const DOOR_COMMAND_WAIT_SECONDS = 10;
 
 export default function DoorControlScreen({ route, navigation }) {
   const { colors } = useTheme();
@@ -130,10 +132,15 @@ export default function DoorControlScreen({ route, navigation }) {
   const openDoor = async () => {
     setLoading(true);
     try {
-      await api.openDoor(door.id, door.default_delay || 3000);
+      const result = await api.openDoor(door.id, door.default_delay || 3000, DOOR_COMMAND_WAIT_SECONDS);
       await Haptics.notificationAsync(Haptics.NotificationFeedbackType.Success);
-      setStatus('Unlocked');
-      setTimeout(() => setStatus('Secured'), door.default_delay || 3000);
+      if (result.status === 'completed') {
+        setStatus('Unlocked');
+        setTimeout(() => setStatus('Secured'), door.default_delay || 3000);
+      } else {
+        // Agent did not report within the wait window; the command is still queued
+        setStatus('Pending');
+      }
     } catch (error) {
       await Haptics.notificationAsync(Haptics.NotificationFeedbackType.Error);
       if (error.isLicenseExpired) {
@@ -151,9 +158,9 @@ export default function DoorControlScreen({ route, navigation }) {
   const closeDoor = async () => {
     setLoading(true);
     try {
-      await api.closeDoor(door.id);
+      const result = await api.closeDoor(door.id, DOOR_COMMAND_WAIT_SECONDS);
       await Haptics.notificationAsync(Haptics.NotificationFeedbackType.Success);
-      setStatus('Secured');
+      setStatus(result.status === 'completed' ? 'Secured' : 'Pending');
     } catch (error) {
       await Haptics.notificationAsync(Haptics.NotificationFeedbackType.Error);
       if (error.isLicenseExpired) {
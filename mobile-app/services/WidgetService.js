@@ -143,8 +143,12 @@ class WidgetService {
       }
 
       // 3. Open the door
-      await api.openDoor(door.id, door.default_delay || 3000);
-      
+      const result = await api.openDoor(door.id, door.default_delay || 3000, 10);
+      if (result.status !== 'completed') {
+        // The agent did not answer within the wait window: queued, not confirmed
+        return { success: true, message: `${door.name}: command queued` };
+      }
+
       return { success: true, message: `${door.name} unlocked` };
     } catch (error) {
       return { success: false, message: error.message || 'Unlock failed' };
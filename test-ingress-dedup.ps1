@@ -0,0 +1,95 @@
+# Test de la déduplication des événements Ingress (POST /agents/{id}/events)
+# Usage: .\test-ingress-dedup.ps1 [-AgentId 1] [-AgentKey CHANGE_ME_AGENT_KEY_1]
+# Un événement renvoyé sans event_time (ou avec une date illisible) ne doit être inséré qu'une fois:
+# sa clé (agent_id, ingress_id) est retenue dans ingress_event_keys, created_at n'y joue aucun rôle.
+# L'agent doit avoir au moins une porte (repli quand device_ip/serial_no ne correspondent à aucune).
+
+param(
+    [int]$AgentId = 1,
+    [string]$AgentKey = "CHANGE_ME_AGENT_KEY_1",
+    [string]$BaseUrl = "http://localhost:8080"
+)
+
+Write-Host "=== Test déduplication Ingress ===" -ForegroundColor Cyan
+Write-Host ""
+
+$headers = @{ "X-Agent-Key" = $AgentKey }
+# Ids hors de la plage d'un vrai door_eventlog, différents à chaque exécution
+$baseId = 2000000000 + (Get-Random -Maximum 100000000)
+
+function Send-Events($events) {
+    $body = @{ events = $events } | ConvertTo-Json -Depth 3
+    return Invoke-RestMethod -Uri "$BaseUrl/agents/$AgentId/events" -Method POST -ContentType "application/json" -Headers $headers -Body $body
+}
+
+$failed = 0
+$cases = @(
+    @{ Name = "sans event_time"; Event = @{ ingress_id = $baseId; event_type = "53"; description = "Test dedup" } },
+    @{ Name = "event_time illisible"; Event = @{ ingress_id = $baseId + 1; event_type = "53"; description = "Test dedup"; event_time = "pas une date" } }
+)
+
+foreach ($case in $cases) {
+    try {
+        $first = Send-Events @($case.Event)
+        Start-Sleep -Seconds 1
+        $second = Send-Events @($case.Event)
+        if ($first.inserted -eq 1 -and $second.inserted -eq 0) {
+            Write-Host "   ✓ Événement $($case.Name): inséré une fois, renvoi ignoré" -ForegroundColor Green
+        } else {
+            Write-Host "   ✗ Événement $($case.Name): inserted=$($first.inserted) puis $($second.inserted) (attendu 1 puis 0)" -ForegroundColor Red
+            $failed++
+        }
+    } catch {
+        Write-Host "   ✗ Événement $($case.Name): $($_.Exception.Message)" -ForegroundColor Red
+        $failed++
+    }
+}
+
+# Même id deux fois dans un seul lot
+try {
+    $dup = @{ ingress_id = $baseId + 2; event_type = "53"; description = "Test dedup" }
+    $result = Send-Events @($dup, $dup)
+    if ($result.inserted -eq 1) {
+        Write-Host "   ✓ Même événement deux fois dans un lot: inséré une fois" -ForegroundColor Green
+    } else {
+        Write-Host "   ✗ Même événement deux fois dans un lot: inserted=$($result.inserted) (attendu 1)" -ForegroundColor Red
+        $failed++
+    }
+} catch {
+    Write-Host "   ✗ Même événement deux fois dans un lot: $($_.Exception.Message)" -ForegroundColor Red
+    $failed++
+}
+
+# Clé refusée (401/403): l'agent garde le lot et le renvoie; rien ne doit être inséré avant le renvoi accepté
+try {
+    $retry = @{ ingress_id = $baseId + 3; event_type = "53"; description = "Test dedup" }
+    $status = 0
+    try {
+        $body = @{ events = @($retry) } | ConvertTo-Json -Depth 3
+        Invoke-RestMethod -Uri "$BaseUrl/agents/$AgentId/events" -Method POST -ContentType "application/json" -Headers @{ "X-Agent-Key" = "invalid-key" } -Body $body | Out-Null
+        $status = 200
+    } catch {
+        $status = [int]$_.Exception.Response.StatusCode
+    }
+    $result = Send-Events @($retry)
+    if (($status -eq 401 -or $status -eq 403) -and $result.inserted -eq 1) {
+        Write-Host "   ✓ Clé refusée (HTTP $status): lot renvoyé ensuite et inséré une fois" -ForegroundColor Green
+    } else {
+        Write-Host "   ✗ Clé refusée: HTTP $status puis inserted=$($result.inserted) (attendu 401/403 puis 1)" -ForegroundColor Red
+        $failed++
+    }
+} catch {
+    Write-Host "   ✗ Clé refusée: $($_.Exception.Message)" -ForegroundColor Red
+    $failed++
+}
+
+Write-Host ""
+Write-Host "   Nettoyage (MySQL):" -ForegroundColor Gray
+Write-Host "   DELETE FROM door_events WHERE agent_id = $AgentId AND ingress_event_id BETWEEN $baseId AND $($baseId + 3);" -ForegroundColor DarkGray
+Write-Host "   DELETE FROM ingress_event_keys WHERE agent_id = $AgentId AND ingress_event_id BETWEEN $baseId AND $($baseId + 3);" -ForegroundColor DarkGray
+Write-Host ""
+if ($failed -gt 0) {
+    Write-Host "=== $failed test(s) en échec ===" -ForegroundColor Red
+    exit 1
+}
+Write-Host "=== Tests réussis ===" -ForegroundColor Cyan
@@ -0,0 +1,47 @@
+# Test de l'encodage des réponses du service (ResponseWriter.Encode)
+# Usage: .\test-response-encoding.ps1 [-Exe chemin\vers\UDM.exe]
+# La taille annoncée (ContentLength64) doit être égale aux octets écrits, même quand une paire de
+# substitution (emoji) est coupée à la limite d'un bloc de 4096 caractères.
+
+param(
+    [string]$Exe = "$PSScriptRoot\BioBridgeDoorControl\BioBridgeDoorControlService\bin\Release\UDM.exe"
+)
+
+Write-Host "=== Test encodage des réponses ===" -ForegroundColor Cyan
+Write-Host ""
+
+if (-not (Test-Path $Exe)) {
+    Write-Host "   ✗ $Exe introuvable (compiler le service d'abord)" -ForegroundColor Red
+    exit 1
+}
+
+$assembly = [System.Reflection.Assembly]::LoadFrom((Resolve-Path $Exe))
+$writer = $assembly.GetType("UDM.ResponseWriter")
+$encode = $writer.GetMethod("Encode", [System.Reflection.BindingFlags]"NonPublic,Static")
+
+$failed = 0
+# Emoji (2 caractères UTF-16) aux index 4094, 4095 et 4096: avant, à cheval sur et après la limite de bloc
+foreach ($index in 4094, 4095, 4096) {
+    $text = ("a" * $index) + [char]::ConvertFromUtf32(0x1F600) + "tail"
+    $expected = [System.Text.Encoding]::UTF8.GetByteCount($text)
+
+    $counted = $encode.Invoke($null, @($text, $null, $null))
+    $stream = New-Object System.IO.MemoryStream
+    $written = $encode.Invoke($null, @($text, $null, $stream))
+    $bytes = $stream.ToArray()
+    $decoded = [System.Text.Encoding]::UTF8.GetString($bytes)
+
+    if ($counted -eq $expected -and $written -eq $expected -and $bytes.Length -eq $expected -and $decoded -eq $text) {
+        Write-Host "   ✓ Emoji à l'index $index : $counted octets comptés = $($bytes.Length) écrits" -ForegroundColor Green
+    } else {
+        Write-Host "   ✗ Emoji à l'index $index : $counted comptés, $($bytes.Length) écrits, $expected attendus" -ForegroundColor Red
+        $failed++
+    }
+}
+
+Write-Host ""
+if ($failed -gt 0) {
+    Write-Host "=== $failed test(s) en échec ===" -ForegroundColor Red
+    exit 1
+}
+Write-Host "=== Tests réussis ===" -ForegroundColor Cyan